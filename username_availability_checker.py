@@ -4,15 +4,29 @@ Username Availability Checker (GUI)
 Checks username availability on: Snapchat, Twitter/X, Instagram, Telegram.
 - Author: ml-ftt
 - Note: This performs simple HTTP checks (HEAD/GET) and infers availability heuristically.
-- Requirements: requests
+- Requirements: requests (optional: orjson for faster JSON export)
 """
 
 import threading
+import socket
+import re
+import queue
+import http.cookiejar
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import csv
 import json
 from pathlib import Path
+from string import Formatter
+from datetime import datetime, timezone
+try:
+    import orjson  # optional: much faster JSON export
+except ImportError:
+    orjson = None
+from collections import OrderedDict
+from urllib.parse import urlsplit
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
@@ -27,76 +41,244 @@ BAD = "#ff4242"
 NEUTRAL = "#cccccc"
 
 # Default request settings
-DEFAULT_TIMEOUT = 10
-DEFAULT_DELAY = 0.6  # seconds between requests per worker (politeness)
+DEFAULT_CONNECT_TIMEOUT = 3.05  # fail fast on dead hosts (just above the 3 s TCP retransmit)
+DEFAULT_READ_TIMEOUT = 10
+DEFAULT_TIMEOUT = (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT)
+DEFAULT_DELAY = 0.6  # seconds between requests to the same host (politeness)
 DEFAULT_WORKERS = 4
+MAX_WORKERS = 20
+DNS_CACHE_TTL = 600  # seconds to reuse a resolved host address
+VERDICT_CACHE_TTL = 300  # seconds to reuse a (platform, username) verdict
+VERDICT_CACHE_SIZE = 10_000
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) UsernameChecker/1.0"
 
-# Platform profile URL templates and detection heuristics
+# UI refresh settings
+DRAIN_INTERVAL_MS = 100  # how often the Tk loop picks up finished results
+DRAIN_BATCH = 200  # max results rendered per pass
+
+# Platform profile URL templates and detection heuristics.
+# "valid" matches usernames the platform accepts; others are never requested
+# and get the verdict "invalid".
 PLATFORMS = {
     "Twitter": {
         "url": "https://twitter.com/{u}",
-        "method": "GET",
+        "method": "HEAD",
         "exists_status": 200,
         "not_found_signs": [404],
+        "valid": re.compile(r"^[A-Za-z0-9_]{1,15}$"),
     },
     "Instagram": {
         "url": "https://www.instagram.com/{u}/",
-        "method": "GET",
+        "method": "HEAD",
         "exists_status": 200,
         "not_found_signs": [404],
+        # Instagram treats usernames case-insensitively
+        "valid": re.compile(r"^[a-z0-9._]{1,30}$", re.I),
     },
     "Telegram": {
         "url": "https://t.me/{u}",
-        "method": "GET",
+        "method": "HEAD",
         "exists_status": 200,
         "not_found_signs": [404],
+        "valid": re.compile(r"^[a-zA-Z0-9_]{5,32}$"),
     },
     "Snapchat": {
         # Snapchat uses /add/username for adding friends
         "url": "https://www.snapchat.com/add/{u}",
+        # GET: the not-found heuristic below needs the page body
         "method": "GET",
+        "need_body": True,
         "exists_status": 200,
         # Snapchat might return 200 with a page for non-existent users too;
         # we check presence of text hint in the page if needed.
         "not_found_signs": [404],
+        "valid": re.compile(r"^[a-zA-Z][a-zA-Z0-9._-]{1,14}$"),
     },
 }
 
+def compile_url(template):
+    """Turn a "...{u}..." template into a fast username -> URL callable."""
+    # parse once with str.format's own rules: every {u} is substituted and
+    # {{ / }} are literal braces
+    parts = [""]
+    for literal, field, spec, conversion in Formatter().parse(template):
+        parts[-1] += literal
+        if field is None:
+            continue
+        if field != "u" or spec or conversion:
+            raise ValueError(f"unsupported URL template field: {{{field}}} in {template!r}")
+        parts.append("")
+    return lambda u: u.join(parts)
+
+for _pdata in PLATFORMS.values():
+    _pdata["url_fn"] = compile_url(_pdata["url"])
+
+# Verdict rules per platform, flattened once: (exists_status, not_found_signs, is_snapchat)
+_RULES = {
+    name: (pf.get("exists_status"), frozenset(pf.get("not_found_signs", [])), name == "Snapchat")
+    for name, pf in PLATFORMS.items()
+}
+
+# In-process DNS cache: the same few hosts are resolved for every username,
+# so remember getaddrinfo() answers for DNS_CACHE_TTL seconds.
+_dns_lock = threading.Lock()
+_dns_cache = {}  # getaddrinfo args -> (expires_at, addrinfo list)
+_system_getaddrinfo = socket.getaddrinfo
+
+def _cached_getaddrinfo(*args, **kwargs):
+    key = (args, tuple(sorted(kwargs.items())))
+    now = time.monotonic()
+    with _dns_lock:
+        hit = _dns_cache.get(key)
+    if hit and hit[0] > now:
+        return hit[1]
+    info = _system_getaddrinfo(*args, **kwargs)
+    with _dns_lock:
+        _dns_cache[key] = (now + DNS_CACHE_TTL, info)
+    return info
+
+def install_dns_cache():
+    """Route socket.getaddrinfo (used by urllib3 when connecting) through the cache."""
+    socket.getaddrinfo = _cached_getaddrinfo
+
+# HTTP sessions: keep connections alive per host so repeated checks skip the
+# TCP/TLS handshake. Each worker thread gets its own session (see get_session).
+# requests/urllib3 speak HTTP/1.1 only, so there is no HTTP/2 multiplexing:
+# each worker holds at most one keep-alive connection per host.
+def make_session(max_workers=1):
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=len(PLATFORMS),  # one pool per host
+        pool_maxsize=max_workers,  # connections kept per host
+        max_retries=Retry(
+            total=2,
+            connect=0,  # a host that won't accept a connection fails after one connect timeout
+            read=0,  # a host that accepts and then stalls fails after one read timeout
+            backoff_factor=0.3,
+            # 429 is not retried: the host is rate limiting us, so report it as
+            # unknown rather than hitting it again outside the per-host bucket
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            # a 503's Retry-After could park the worker for minutes; use our backoff only
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    # never store cookies: a Set-Cookie from one probe must not follow later probes
+    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+_thread_state = threading.local()
+
+def get_session():
+    """Return this thread's session, creating it on first use."""
+    session = getattr(_thread_state, "session", None)
+    if session is None:
+        session = _thread_state.session = make_session()
+    return session
+
+# Per-host politeness: a token bucket per host hands out one request slot
+# every `min_interval` seconds. Requests to different hosts never wait on each other.
+class TokenBucket:
+    def __init__(self, min_interval, capacity=1):
+        self.min_interval = min_interval
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_ts = time.monotonic()
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            while True:
+                if self.min_interval <= 0:
+                    return
+                now = time.monotonic()
+                refill = (now - self.last_ts) / self.min_interval
+                self.tokens = min(self.capacity, self.tokens + refill)
+                self.last_ts = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                self._cond.wait((1 - self.tokens) * self.min_interval)
+
+HOST_BUCKETS = {}  # host -> TokenBucket
+_buckets_lock = threading.Lock()
+
+def host_bucket(host, min_interval):
+    with _buckets_lock:
+        bucket = HOST_BUCKETS.get(host)
+        if bucket is None:
+            bucket = HOST_BUCKETS[host] = TokenBucket(min_interval)
+        else:
+            # delay may be changed in the GUI between runs
+            bucket.min_interval = min_interval
+        return bucket
+
+# Status codes meaning "HEAD not supported here" -> retry the probe as GET
+HEAD_FALLBACK_STATUS = (405, 501)
+
 # Helper: polite HTTP request wrapper
-def http_check(url, method="GET", timeout=DEFAULT_TIMEOUT, headers=None):
-    headers = headers or {"User-Agent": USER_AGENT}
+def http_check(url, method="GET", timeout=DEFAULT_TIMEOUT, headers=None, session=None,
+               delay=DEFAULT_DELAY, need_body=True):
+    """
+    Probe url and return {"ok", "status_code", "body"} or {"ok": False, "error"}.
+    With need_body=False only the status line and headers are read; "body" is empty.
+    """
+    session = session or get_session()
+    bucket = host_bucket(urlsplit(url).netloc, delay)
+    bucket.acquire()
     try:
+        r = None
         if method.upper() == "HEAD":
-            r = requests.head(url, timeout=timeout, headers=headers, allow_redirects=True)
-        else:
-            r = requests.get(url, timeout=timeout, headers=headers, allow_redirects=True)
-        return {"ok": True, "status_code": r.status_code, "text": r.text[:2000]}
+            r = session.head(url, timeout=timeout, headers=headers, allow_redirects=True)
+            if r.status_code in HEAD_FALLBACK_STATUS:
+                # the fallback GET is a second request to the host: wait for its own slot
+                bucket.acquire()
+                r = None
+        if r is None:
+            r = session.get(url, timeout=timeout, headers=headers, allow_redirects=True,
+                            stream=not need_body)
+        if not need_body:
+            r.close()
+            return {"ok": True, "status_code": r.status_code, "body": b""}
+        return {"ok": True, "status_code": r.status_code, "body": r.content[:2000]}
     except requests.exceptions.RequestException as e:
         return {"ok": False, "error": str(e)}
 
+# Separators accepted in the username input box
+_SPLIT = re.compile(r"[,\s]+")
+
+# Snapchat serves its normal page template for missing users; these phrases
+# in the (raw bytes) body mean the account does not exist.
+SNAP_NEG = re.compile(rb"couldn't find|not found|try again", re.I)
+
 # Heuristic evaluate response -> availability
 def evaluate_platform_response(platform_name, response):
     """
     Return one of: "taken", "available", "unknown"
     Uses status code rules and some content heuristics for Snapchat.
+    (The fourth verdict, "invalid", comes from check_platform's format check;
+    those names never get a response to evaluate.)
     """
     if not response.get("ok"):
         return "unknown", response.get("error")
     sc = response.get("status_code", 0)
-    pf = PLATFORMS.get(platform_name)
-    if not pf:
+    rules = _RULES.get(platform_name)
+    if not rules:
         return "unknown", "no rules for platform"
+    exists_status, not_found, is_snapchat = rules
     # direct checks
-    if sc in pf.get("not_found_signs", []):
+    if sc in not_found:
         return "available", f"status:{sc}"
     # status 200 typically means exists
-    if sc == pf.get("exists_status"):
+    if sc == exists_status:
         # Snapchat extra heuristics: sometimes Snapchat returns same template for non-existing usernames.
-        if platform_name == "Snapchat":
-            text = (response.get("text") or "").lower()
+        if is_snapchat:
             # If page contains "couldn't find" or similar phrases -> available
-            if "couldn't find" in text or "not found" in text or "try again" in text:
+            if SNAP_NEG.search(response.get("body") or b""):
                 return "available", "snapchat page says not found"
             # else assume exists
             return "taken", f"status:{sc}"
@@ -111,30 +293,106 @@ def evaluate_platform_response(platform_name, response):
     # fallback unknown
     return "unknown", f"status:{sc}"
 
+# Short-lived LRU of verdicts so re-running an overlapping list skips the network
+class VerdictCache:
+    def __init__(self, maxsize=VERDICT_CACHE_SIZE, ttl=VERDICT_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # (platform, username) -> (expires_at, result)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is None:
+                return None
+            if hit[0] <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return dict(hit[1])
+
+    def put(self, key, result):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, dict(result))
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+VERDICT_CACHE = VerdictCache()
+
+# Worker function for a single (username, platform) pair
+def check_platform(username, pname, pdata, delay_per_request=DEFAULT_DELAY, timeout=DEFAULT_TIMEOUT,
+                   session=None, use_cache=True):
+    """
+    Check one username on one platform.
+    Returns the per-platform result dict (verdict, reason, status_code), where
+    verdict is "taken", "available", "unknown" or "invalid" (name breaks the
+    platform's username rules; no request is made).
+    Definite verdicts are cached; "unknown" results are always retried.
+    """
+    valid = pdata.get("valid")
+    if valid is not None and not valid.match(username):
+        # the platform can't have this name, so it can't be registered either
+        return {"verdict": "invalid", "reason": "invalid-format", "status_code": None}
+    key = (pname, username)
+    if use_cache:
+        cached = VERDICT_CACHE.get(key)
+        if cached is not None:
+            return cached
+    url_fn = pdata.get("url_fn") or compile_url(pdata["url"])
+    url = url_fn(username)
+    # Make request
+    r = http_check(
+        url,
+        method=pdata.get("method", "GET"),
+        timeout=timeout,
+        session=session,
+        delay=delay_per_request,
+        need_body=pdata.get("need_body", False)
+    )
+    verdict, reason = evaluate_platform_response(pname, r)
+    result = {
+        "verdict": verdict,
+        "reason": reason,
+        "status_code": r.get("status_code") if r.get("ok") else None
+    }
+    if verdict != "unknown":
+        VERDICT_CACHE.put(key, result)
+    return result
+
 # Worker function for a single username
-def check_username(username, platforms, delay_per_request=DEFAULT_DELAY, timeout=DEFAULT_TIMEOUT):
+def check_username(username, platforms, delay_per_request=DEFAULT_DELAY, timeout=DEFAULT_TIMEOUT,
+                   session=None, use_cache=True):
     """
     Check username across platforms dict (keys are platform names).
     Returns a dict of results per platform.
     """
+    session = session or get_session()
     res = {
         "username": username,
-        "checked_at": time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "checked_at": None,
         "results": {}
     }
+    # each platform is its own host, so the per-host delay never makes this loop wait
+    # for a different platform; the GUI schedules platforms in parallel instead
     for pname, pdata in platforms.items():
-        url = pdata["url"].format(u=username)
-        # Make request
-        r = http_check(url, method=pdata.get("method", "GET"), timeout=timeout)
-        verdict, reason = evaluate_platform_response(pname, r)
-        res["results"][pname] = {
-            "verdict": verdict,
-            "reason": reason,
-            "status_code": r.get("status_code") if r.get("ok") else None
-        }
-        time.sleep(delay_per_request)
+        res["results"][pname] = check_platform(
+            username, pname, pdata,
+            delay_per_request=delay_per_request,
+            timeout=timeout,
+            session=session,
+            use_cache=use_cache
+        )
+    res["checked_at"] = time.time()
     return res
 
+def format_timestamp(ts):
+    """Format an epoch `checked_at` value as a UTC ISO-8601 string for export."""
+    if not isinstance(ts, (int, float)):
+        return ts
+    return datetime.fromtimestamp(ts, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
 # GUI application
 class UsernameCheckerGUI:
     def __init__(self, root):
@@ -167,7 +425,7 @@ class UsernameCheckerGUI:
 
         tk.Label(
             ctrl,
-            text="Enter username(s) (comma or newline separated):",
+            text="Enter username(s) (comma, space or newline separated):",
             bg=WINDOW_BG,
             fg=TEXT_FG
         ).grid(row=0, column=0, sticky="w")
@@ -185,7 +443,7 @@ class UsernameCheckerGUI:
         tk.Spinbox(
             ctrl,
             from_=1,
-            to=20,
+            to=MAX_WORKERS,
             textvariable=self.workers_var,
             width=4
         ).grid(row=2, column=1, sticky="w")
@@ -201,6 +459,18 @@ class UsernameCheckerGUI:
             width=6
         ).grid(row=2, column=3, sticky="w")
 
+        self.bypass_cache_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            ctrl,
+            text="Bypass cache",
+            variable=self.bypass_cache_var,
+            bg=WINDOW_BG,
+            fg=TEXT_FG,
+            selectcolor=PANEL_BG,
+            activebackground=WINDOW_BG,
+            activeforeground=TEXT_FG
+        ).grid(row=2, column=4, sticky="w")
+
         self.start_btn = ttk.Button(ctrl, text="Start Check", command=self.start_check)
         self.start_btn.grid(row=3, column=0, pady=8)
         ttk.Button(ctrl, text="Clear Results", command=self.clear_results).grid(row=3, column=1, pady=8)
@@ -223,6 +493,11 @@ class UsernameCheckerGUI:
         self.tree.column("platform", width=140)
         self.tree.column("verdict", width=120)
         self.tree.column("reason", width=520)
+        # row colour per verdict
+        self.tree.tag_configure("available", foreground=GOOD)
+        self.tree.tag_configure("taken", foreground=BAD)
+        self.tree.tag_configure("unknown", foreground=NEUTRAL)
+        self.tree.tag_configure("invalid", foreground=NEUTRAL)
         self.tree.pack(fill=tk.BOTH, expand=True)
 
         # status bar
@@ -236,7 +511,29 @@ class UsernameCheckerGUI:
 
         # internal state
         self.results = []  # list of dicts per username
-        self._lock = threading.Lock()
+        # worker threads never touch Tk widgets; they hand results to the
+        # main loop through this queue (None marks the end of a run)
+        self._result_queue = queue.Queue()
+        self.root.after(DRAIN_INTERVAL_MS, self._drain_queue)
+        # worker pool is kept across runs so threads (and their sessions) stay warm
+        self.executor = ThreadPoolExecutor(max_workers=DEFAULT_WORKERS, thread_name_prefix="uchk")
+        self._executor_workers = DEFAULT_WORKERS
+        self._futures = []
+        root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    def _get_executor(self, workers):
+        # replace the pool only when the worker count changed
+        if workers != self._executor_workers:
+            self.executor.shutdown(wait=False)
+            self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="uchk")
+            self._executor_workers = workers
+        return self.executor
+
+    def on_close(self):
+        for fut in self._futures:
+            fut.cancel()
+        self.executor.shutdown(wait=False)
+        self.root.destroy()
 
     def clear_results(self):
         self.tree.delete(*self.tree.get_children())
@@ -248,65 +545,121 @@ class UsernameCheckerGUI:
         if not raw:
             messagebox.showinfo("Input required", "Enter at least one username.")
             return
-        # parse usernames: split by comma or newline; remove empties and strip
-        parts = [p.strip() for p in raw.replace(",", "\n").splitlines()]
-        usernames = [p for p in parts if p]
+        # parse usernames: split on commas and any whitespace; accept "@handle"; drop empties
+        usernames = [u.lstrip("@") for u in _SPLIT.split(raw)]
+        usernames = [u for u in usernames if u]
         if not usernames:
             messagebox.showinfo("Input required", "Enter at least one username.")
             return
 
         workers = max(1, int(self.workers_var.get()))
         delay = float(self.delay_var.get())
+        use_cache = not self.bypass_cache_var.get()
         self.status_var.set(
             f"Starting checks for {len(usernames)} usernames with {workers} workers..."
         )
         self.start_btn.config(state="disabled")
+        self.results = []
 
         # run checks in background thread to keep UI responsive
         threading.Thread(
             target=self._run_checks_thread,
-            args=(usernames, workers, delay),
+            args=(usernames, self._get_executor(workers), delay, use_cache),
             daemon=True
         ).start()
 
-    def _run_checks_thread(self, usernames, workers, delay):
-        self.results = []
+    def _run_checks_thread(self, usernames, executor, delay, use_cache=True):
         platforms = PLATFORMS
-        with ThreadPoolExecutor(max_workers=workers) as ex:
-            futures = {
-                ex.submit(
-                    check_username,
-                    u,
-                    platforms,
-                    delay_per_request=delay
-                ): u
-                for u in usernames
+        # one result record per unique username, filled in as platform checks finish
+        pending = {
+            u: {
+                "username": u,
+                "checked_at": None,  # set when the last platform result arrives
+                "results": {}
             }
-            for fut in as_completed(futures):
-                u = futures[fut]
-                try:
-                    r = fut.result()
-                except Exception as e:
-                    r = {"username": u, "error": str(e)}
-                # store and render
-                with self._lock:
-                    self.results.append(r)
-                    self._render_result(r)
-        self.status_var.set("All checks completed.")
-        self.start_btn.config(state="normal")
-
-    def _render_result(self, result):
-        # result has username and results per platform
-        uname = result.get("username")
-        for platform, info in result.get("results", {}).items():
-            verdict = info.get("verdict", "unknown")
-            reason = info.get("reason", "")
-            self.tree.insert(
-                "",
-                0,
-                values=(f"{uname} - {platform}", verdict, reason)
-            )
-        self.status_var.set(f"Last checked: {uname}")
+            for u in dict.fromkeys(usernames)
+        }
+        # schedule every (username, platform) pair as its own task so the
+        # pool stays busy across hosts instead of walking platforms serially
+        futures = {
+            executor.submit(
+                check_platform,
+                u,
+                pname,
+                pdata,
+                delay_per_request=delay,
+                use_cache=use_cache
+            ): (u, pname)
+            for u in pending
+            for pname, pdata in platforms.items()
+        }
+        self._futures = list(futures)
+        for fut in as_completed(futures):
+            u, pname = futures[fut]
+            try:
+                info = fut.result()
+            except Exception as e:
+                info = {"verdict": "unknown", "reason": str(e), "status_code": None}
+            r = pending[u]
+            r["results"][pname] = info
+            if len(r["results"]) < len(platforms):
+                continue
+            r["checked_at"] = time.time()
+            # checks finish in any order; present them in PLATFORMS order
+            r["results"] = {pname: r["results"][pname] for pname in platforms}
+            self._result_queue.put(r)
+        self._result_queue.put(None)
+
+    def _drain_queue(self):
+        # runs on the Tk main loop: store and render whatever the workers finished
+        batch = []
+        done = False
+        for _ in range(DRAIN_BATCH):
+            try:
+                r = self._result_queue.get_nowait()
+            except queue.Empty:
+                break
+            if r is None:
+                done = True
+                continue
+            batch.append(r)
+        if batch:
+            self.results.extend(batch)
+            self._render_results(batch)
+        if done:
+            self.status_var.set("All checks completed.")
+            self.start_btn.config(state="normal")
+        self.root.after(DRAIN_INTERVAL_MS, self._drain_queue)
+
+    def _render_results(self, results):
+        # insert the whole batch, then lay the tree out once instead of per row
+        for result in results:
+            # result has username and results per platform
+            uname = result.get("username")
+            for platform, info in result.get("results", {}).items():
+                verdict = info.get("verdict", "unknown")
+                reason = info.get("reason", "")
+                self.tree.insert(
+                    "",
+                    0,
+                    values=(f"{uname} - {platform}", verdict, reason),
+                    tags=(verdict,)
+                )
+        self.status_var.set(f"Last checked: {results[-1].get('username')}")
+        self.tree.update_idletasks()
+
+    def iter_rows(self):
+        # one flat row per (username, platform), generated lazily for export
+        for r in self.results:
+            uname = r.get("username")
+            for platform, info in r.get("results", {}).items():
+                yield (
+                    uname,
+                    platform,
+                    info.get("verdict"),
+                    info.get("reason"),
+                    info.get("status_code")
+                )
 
     def export_csv(self):
         if not self.results:
@@ -319,25 +672,10 @@ class UsernameCheckerGUI:
         )
         if not path:
             return
-        rows = []
-        for r in self.results:
-            uname = r.get("username")
-            for platform, info in r.get("results", {}).items():
-                rows.append({
-                    "username": uname,
-                    "platform": platform,
-                    "verdict": info.get("verdict"),
-                    "reason": info.get("reason"),
-                    "status_code": info.get("status_code")
-                })
         with open(path, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=["username", "platform", "verdict", "reason", "status_code"]
-            )
-            writer.writeheader()
-            for row in rows:
-                writer.writerow(row)
+            writer = csv.writer(f)
+            writer.writerow(["username", "platform", "verdict", "reason", "status_code"])
+            writer.writerows(self.iter_rows())
         messagebox.showinfo("Saved", f"CSV saved to: {path}")
 
     def export_json(self):
@@ -351,12 +689,24 @@ class UsernameCheckerGUI:
         )
         if not path:
             return
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.results, f, ensure_ascii=False, indent=2)
+        records = [
+            {**r, "checked_at": format_timestamp(r.get("checked_at"))}
+            for r in self.results
+        ]
+        if orjson is not None:
+            with open(path, "wb") as f:
+                f.write(orjson.dumps(
+                    records,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ))
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(records, f, ensure_ascii=False, indent=2)
         messagebox.showinfo("Saved", f"JSON saved to: {path}")
 
 # Run app
 def main():
+    install_dns_cache()
     root = tk.Tk()
     app = UsernameCheckerGUI(root)
     root.mainloop()